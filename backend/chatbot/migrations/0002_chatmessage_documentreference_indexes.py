@@ -0,0 +1,25 @@
+# Generated by Django 5.0.2
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='chatmessage',
+            index=models.Index(fields=['session', 'created_at'], name='chatbot_cha_session_c4a1f2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='documentreference',
+            index=models.Index(fields=['message'], name='chatbot_doc_message_8f31ad_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='documentreference',
+            index=models.Index(fields=['document'], name='chatbot_doc_documen_5b20c7_idx'),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.0.2
+#
+# Switches chat models from random-UUID primary keys to bigint PKs with a
+# separate public_id UUID column. UUID PK values cannot be cast to bigint
+# in place, so the chat tables are rebuilt; chat data at this stage of the
+# project is development-only.
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dochub', '0003_document_folder_name_index'),
+        ('chatbot', '0003_chatmessage_status'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(name='DocumentReference'),
+        migrations.DeleteModel(name='ChatMessage'),
+        migrations.DeleteModel(name='ChatSession'),
+        migrations.CreateModel(
+            name='ChatSession',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('public_id', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('title', models.CharField(max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ChatMessage',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('public_id', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('role', models.CharField(choices=[('user', 'User'), ('assistant', 'Assistant')], max_length=10)),
+                ('content', models.TextField()),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('complete', 'Complete'), ('error', 'Error')], default='complete', max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('session', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='messages', to='chatbot.chatsession')),
+            ],
+            options={
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['session', 'created_at'], name='chatbot_cha_session_c4a1f2_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='DocumentReference',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('relevance_score', models.FloatField(default=0.0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='dochub.document')),
+                ('message', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='document_references', to='chatbot.chatmessage')),
+            ],
+            options={
+                'indexes': [
+                    models.Index(fields=['message'], name='chatbot_doc_message_8f31ad_idx'),
+                    models.Index(fields=['document'], name='chatbot_doc_documen_5b20c7_idx'),
+                ],
+            },
+        ),
+    ]
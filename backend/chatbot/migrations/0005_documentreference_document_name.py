@@ -0,0 +1,27 @@
+# Generated by Django 5.0.2
+
+from django.db import migrations, models
+
+
+def populate_document_names(apps, schema_editor):
+    DocumentReference = apps.get_model('chatbot', 'DocumentReference')
+    for reference in DocumentReference.objects.select_related('document').iterator():
+        DocumentReference.objects.filter(pk=reference.pk).update(
+            document_name=reference.document.name
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0004_bigint_pk_public_uuid'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documentreference',
+            name='document_name',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.RunPython(populate_document_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.2
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0005_documentreference_document_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='documentreference',
+            index=models.Index(fields=['message', '-relevance_score'], name='docref_msg_rel_idx'),
+        ),
+    ]
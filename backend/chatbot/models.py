@@ -6,7 +6,10 @@ from dochub.models import Document
 
 class ChatSession(models.Model):
     """Chat session model"""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Bigint PK for compact indexes and fast joins; the UUID clients see
+    # lives in public_id.
+    id = models.BigAutoField(primary_key=True)
+    public_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
     title = models.CharField(max_length=255)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -20,11 +23,18 @@ class ChatMessage(models.Model):
         ('user', 'User'),
         ('assistant', 'Assistant'),
     )
-    
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        ('complete', 'Complete'),
+        ('error', 'Error'),
+    )
+
+    id = models.BigAutoField(primary_key=True)
+    public_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
     session = models.ForeignKey(ChatSession, on_delete=models.CASCADE, related_name='messages')
     role = models.CharField(max_length=10, choices=ROLE_CHOICES)
     content = models.TextField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='complete')
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
@@ -32,13 +42,36 @@ class ChatMessage(models.Model):
 
     class Meta:
         ordering = ['created_at']
+        indexes = [
+            # Named explicitly to match the migrations (0002/0004), so
+            # makemigrations never emits spurious RenameIndex operations
+            models.Index(fields=['session', 'created_at'], name='chatbot_cha_session_c4a1f2_idx'),
+        ]
 
 class DocumentReference(models.Model):
     """References to documents used in chat messages"""
     message = models.ForeignKey(ChatMessage, on_delete=models.CASCADE, related_name='document_references')
     document = models.ForeignKey(Document, on_delete=models.CASCADE)
+    # Denormalized copy of document.name so chat reads skip the Document
+    # join; kept fresh by the Document post_save handler in signals.py.
+    document_name = models.CharField(max_length=255, blank=True)
     relevance_score = models.FloatField(default=0.0)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    def save(self, *args, **kwargs):
+        if not self.document_name and self.document_id:
+            self.document_name = self.document.name
+        super().save(*args, **kwargs)
+
     def __str__(self):
-        return f"Reference to {self.document.name} in message {self.message.id}"
+        return f"Reference to {self.document_name} in message {self.message.id}"
+
+    class Meta:
+        indexes = [
+            # Named explicitly to match the migrations (0002/0004)
+            models.Index(fields=['message'], name='chatbot_doc_message_8f31ad_idx'),
+            models.Index(fields=['document'], name='chatbot_doc_documen_5b20c7_idx'),
+            # Serves top-K reference lookups:
+            # .filter(message=...).order_by('-relevance_score')[:k]
+            models.Index(fields=['message', '-relevance_score'], name='docref_msg_rel_idx'),
+        ]
@@ -3,28 +3,61 @@
 from rest_framework import serializers
 from .models import ChatSession, ChatMessage, DocumentReference
 
-class DocumentReferenceSerializer(serializers.ModelSerializer):
+class SerializerCacheMixin:
+    """
+    Memoize to_representation per object PK for the lifetime of the
+    serializer instance (i.e. one request). With many=True DRF reuses a
+    single child serializer, so an object that appears several times in
+    a nested payload is only serialized once.
+    """
+    def to_representation(self, instance):
+        pk = getattr(instance, 'pk', None)
+        if pk is None:
+            return super().to_representation(instance)
+
+        cache = getattr(self, '_representation_cache', None)
+        if cache is None:
+            cache = self._representation_cache = {}
+
+        if pk not in cache:
+            cache[pk] = super().to_representation(instance)
+        return cache[pk]
+
+class DocumentReferenceSerializer(SerializerCacheMixin, serializers.ModelSerializer):
     """Serializer for DocumentReference model"""
-    document_name = serializers.ReadOnlyField(source='document.name')
+    # Denormalized on the model, so rendering a reference never joins to
+    # the Document table.
+    document_name = serializers.CharField(read_only=True)
     
     class Meta:
         model = DocumentReference
         fields = ['id', 'document', 'document_name', 'relevance_score']
 
-class ChatMessageSerializer(serializers.ModelSerializer):
+class ChatMessageSerializer(SerializerCacheMixin, serializers.ModelSerializer):
     """Serializer for ChatMessage model"""
+    id = serializers.UUIDField(source='public_id', read_only=True)
     document_references = DocumentReferenceSerializer(many=True, read_only=True)
     
     class Meta:
         model = ChatMessage
-        fields = ['id', 'role', 'content', 'created_at', 'document_references']
-        read_only_fields = ['created_at']
+        fields = ['id', 'role', 'content', 'status', 'created_at', 'document_references']
+        read_only_fields = ['status', 'created_at']
 
-class ChatSessionSerializer(serializers.ModelSerializer):
+class ChatSessionSerializer(SerializerCacheMixin, serializers.ModelSerializer):
     """Serializer for ChatSession model"""
+    id = serializers.UUIDField(source='public_id', read_only=True)
     messages = ChatMessageSerializer(many=True, read_only=True)
-    
+
     class Meta:
         model = ChatSession
         fields = ['id', 'title', 'created_at', 'updated_at', 'messages']
+        read_only_fields = ['created_at', 'updated_at']
+
+class ChatSessionListSerializer(SerializerCacheMixin, serializers.ModelSerializer):
+    """Lightweight session serializer for list views (no nested messages)"""
+    id = serializers.UUIDField(source='public_id', read_only=True)
+
+    class Meta:
+        model = ChatSession
+        fields = ['id', 'title', 'created_at', 'updated_at']
         read_only_fields = ['created_at', 'updated_at']
\ No newline at end of file
@@ -0,0 +1,46 @@
+# chatbot/signals.py
+
+import logging
+from django.core.cache import caches
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from dochub.models import Document
+from .models import ChatSession, ChatMessage, DocumentReference
+
+logger = logging.getLogger(__name__)
+
+@receiver(post_save, sender=Document)
+def sync_document_reference_names(sender, instance, created, **kwargs):
+    """
+    Keep the denormalized DocumentReference.document_name in sync when a
+    document is renamed.
+
+    Args:
+        sender: The model class
+        instance: The Document that was saved
+        created: Boolean; True if a new record was created
+    """
+    if created:
+        return  # New documents have no references yet
+
+    updated = DocumentReference.objects.filter(document=instance).exclude(
+        document_name=instance.name
+    ).update(document_name=instance.name)
+
+    if updated:
+        logger.debug(f"Updated document_name on {updated} references for document {instance.id}")
+
+@receiver(post_save, sender=ChatSession)
+@receiver(post_delete, sender=ChatSession)
+@receiver(post_save, sender=ChatMessage)
+@receiver(post_delete, sender=ChatMessage)
+def invalidate_cached_responses(sender, **kwargs):
+    """
+    Drop cached session GET responses whenever chat rows change, so
+    cache_page never serves stale listings.
+
+    Only the page-cache alias is cleared; the default cache holds
+    durable entries (embeddings, graph payloads) that must survive
+    ordinary chat writes.
+    """
+    caches['pages'].clear()
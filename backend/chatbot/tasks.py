@@ -0,0 +1,54 @@
+# chatbot/tasks.py
+
+import logging
+from celery import shared_task
+from django.db import transaction
+
+from .models import ChatMessage
+
+logger = logging.getLogger(__name__)
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def generate_rag_response(self, message_id, session_id):
+    """
+    Celery task to generate the assistant response for a chat message.
+
+    The HTTP POST creates the assistant message with status='pending' and
+    returns immediately; this task fills in the content off the request
+    thread. The actual RAG pipeline (retrieval + LLM call) will plug in
+    here; for now it writes the placeholder response.
+
+    Args:
+        message_id: ID of the pending assistant ChatMessage
+        session_id: ID of the chat session (for retrieval context)
+
+    Returns:
+        dict: Generation results
+    """
+    logger.info(f"Generating assistant response for message {message_id} in session {session_id}")
+
+    try:
+        # In a real implementation, this would call the RAG pipeline
+        # (embed the question, retrieve chunks, call the LLM)
+        content = "This is a placeholder response. The RAG system will be implemented soon."
+
+        with transaction.atomic():
+            updated = ChatMessage.objects.filter(id=message_id).update(
+                content=content,
+                status='complete'
+            )
+
+        if not updated:
+            logger.error(f"Assistant message {message_id} not found")
+            return {"status": "error", "error": f"Message {message_id} not found"}
+
+        return {"status": "success", "message_id": message_id}
+
+    except Exception as e:
+        logger.error(f"Error generating assistant response for {message_id}: {str(e)}")
+
+        if self.request.retries < self.max_retries:
+            raise self.retry(exc=e)
+
+        ChatMessage.objects.filter(id=message_id).update(status='error')
+        return {"status": "error", "message_id": message_id, "error": str(e)}
@@ -1,54 +1,137 @@
 # chatbot/views.py
 
+import json
+
+from django.db import transaction
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
+from django.http import StreamingHttpResponse
+from django.db.models import Prefetch
 from rest_framework import viewsets, status, generics
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
-from .models import ChatSession, ChatMessage
-from .serializers import ChatSessionSerializer, ChatMessageSerializer
+from .models import ChatSession, ChatMessage, DocumentReference
+from .serializers import (
+    ChatSessionSerializer,
+    ChatSessionListSerializer,
+    ChatMessageSerializer
+)
+from .tasks import generate_rag_response
+
+# Prefetch chain matching the nested serializers: session -> messages ->
+# document_references. document_name is denormalized onto the reference
+# rows, so serialization never touches the Document table.
+MESSAGE_REFERENCES_PREFETCH = Prefetch(
+    'document_references',
+    queryset=DocumentReference.objects.all()
+)
 
+# Session lists are read-heavy; cache the rendered JSON briefly on the
+# dedicated page-cache alias. Writes clear that alias via the signal
+# handlers in signals.py.
+@method_decorator(cache_page(60, cache='pages'), name='list')
 class ChatSessionViewSet(viewsets.ModelViewSet):
     """ViewSet for ChatSession model"""
     serializer_class = ChatSessionSerializer
-    
+    lookup_field = 'public_id'
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return ChatSessionListSerializer
+        return ChatSessionSerializer
+
     def get_queryset(self):
-        return ChatSession.objects.all()
+        # The list view only renders session metadata, so skip both the
+        # message prefetch and the TextField content entirely.
+        if self.action == 'list':
+            return ChatSession.objects.only('id', 'public_id', 'title', 'created_at', 'updated_at')
+
+        return ChatSession.objects.prefetch_related(
+            Prefetch(
+                'messages',
+                queryset=ChatMessage.objects.order_by('created_at').prefetch_related(
+                    MESSAGE_REFERENCES_PREFETCH
+                )
+            )
+        )
+
+class ChatMessagePagination(CursorPagination):
+    """Cursor pagination over the (session, created_at) index"""
+    ordering = 'created_at'
+    page_size = 50
 
 class ChatMessageListCreate(generics.ListCreateAPIView):
     """List and create chat messages"""
     serializer_class = ChatMessageSerializer
-    
+    pagination_class = ChatMessagePagination
+
     def get_queryset(self):
         session_id = self.kwargs.get('session_id')
-        return ChatMessage.objects.filter(session_id=session_id)
+        return ChatMessage.objects.filter(session__public_id=session_id).prefetch_related(
+            MESSAGE_REFERENCES_PREFETCH
+        )
     
     def create(self, request, *args, **kwargs):
         session_id = self.kwargs.get('session_id')
-        try:
-            session = ChatSession.objects.get(id=session_id)
-        except ChatSession.DoesNotExist:
+        # Fetch only the PK: we just need to know the session exists and
+        # have something to hang the assistant message's FK on.
+        session = ChatSession.objects.filter(public_id=session_id).only('id').first()
+        if session is None:
             return Response(
-                {"error": "Chat session not found"}, 
+                {"error": "Chat session not found"},
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # Create user message
+        # Validate the user message payload
         serializer = self.get_serializer(data={
             **request.data,
             "role": "user",
             "session": session_id
         })
         serializer.is_valid(raise_exception=True)
-        user_message = serializer.save()
-        
-        # In a real implementation, this would call the RAG pipeline to generate a response
-        # For now, just create a placeholder assistant message
-        assistant_message = ChatMessage.objects.create(
+
+        # The assistant message starts as a pending stub; the Celery task
+        # generates its content off the request thread and clients poll
+        # for it. Both rows go in with a single bulk_create.
+        user_message = ChatMessage(
+            session=session,
+            role="user",
+            content=serializer.validated_data['content']
+        )
+        assistant_message = ChatMessage(
             session=session,
             role="assistant",
-            content="This is a placeholder response. The RAG system will be implemented soon."
+            content="",
+            status="pending"
         )
+        with transaction.atomic():
+            ChatMessage.objects.bulk_create([user_message, assistant_message])
+
+        # Queue RAG response generation (bulk_create populates the bigint
+        # PKs via RETURNING)
+        generate_rag_response.delay(assistant_message.pk, str(session_id))
         
-        # Return both messages
-        return Response({
-            "user_message": self.get_serializer(user_message).data,
-            "assistant_message": self.get_serializer(assistant_message).data
-        }, status=status.HTTP_201_CREATED)
+        # Return both messages. The representation of a just-created
+        # message is trivially known (no document references yet), so
+        # build it directly instead of re-running the serializer.
+        def message_payload(msg):
+            return {
+                "id": str(msg.public_id),
+                "role": msg.role,
+                "content": msg.content,
+                "status": msg.status,
+                "created_at": msg.created_at.isoformat() if msg.created_at else None,
+                "document_references": []
+            }
+
+        # Stream the two messages as NDJSON so the user-message ack can
+        # flush to the client before the assistant payload is rendered.
+        def stream():
+            yield json.dumps({"user_message": message_payload(user_message)}) + "\n"
+            yield json.dumps({"assistant_message": message_payload(assistant_message)}) + "\n"
+
+        return StreamingHttpResponse(
+            stream(),
+            content_type='application/x-ndjson',
+            status=status.HTTP_201_CREATED
+        )
@@ -11,5 +11,14 @@ app = Celery('dochub')
 # Use a string here for serialization
 app.config_from_object('django.conf:settings', namespace='CELERY')
 
-# Auto-discover tasks in all installed apps
-app.autodiscover_tasks(['dochub'])
\ No newline at end of file
+# Auto-discover tasks in all installed apps. With no arguments this
+# lazily scans INSTALLED_APPS once Django is ready, so new apps don't
+# need to be hard-coded here.
+app.autodiscover_tasks()
+
+# RAG/document tasks are long-running: ack after completion and fetch one
+# task at a time so a slow task doesn't starve queued peers.
+app.conf.update(
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+)
\ No newline at end of file
@@ -0,0 +1,23 @@
+# backend/config/renderers.py
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    DRF renderer backed by orjson.
+
+    orjson encodes 2-5x faster than the stdlib json module, which matters
+    most for the large graph payloads (thousands of nodes with property
+    bags) returned by the dochub graph endpoints.
+    """
+
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
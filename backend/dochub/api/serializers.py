@@ -1,13 +1,17 @@
 # backend/dochub/api/serializers.py
 
+from django.db import transaction
 from rest_framework import serializers
 from ..models import Document, Folder
 
 class FolderSerializer(serializers.ModelSerializer):
     """Serializer for Folder model"""
     
-    document_count = serializers.SerializerMethodField()
-    subfolder_count = serializers.SerializerMethodField()
+    # Read from the num_documents/num_subfolders annotations added in
+    # FolderViewSet.get_queryset; the default covers freshly created
+    # instances that never went through the annotated queryset.
+    document_count = serializers.IntegerField(source='num_documents', read_only=True, default=0)
+    subfolder_count = serializers.IntegerField(source='num_subfolders', read_only=True, default=0)
     path = serializers.SerializerMethodField()
     
     class Meta:
@@ -24,22 +28,18 @@ class FolderSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
     
-    def get_document_count(self, obj):
-        """Get count of documents in this folder"""
-        return obj.documents.count()
-    
-    def get_subfolder_count(self, obj):
-        """Get count of subfolders in this folder"""
-        return obj.subfolders.count()
-    
     def get_path(self, obj):
         """Get folder path"""
         return obj.path
     
     def validate_name(self, value):
         """Validate folder name uniqueness within a parent folder"""
+        # Unchanged name on update can't introduce a duplicate; skip the query
+        if self.instance is not None and self.instance.name == value:
+            return value
+
         parent = self.initial_data.get('parent')
-        
+
         # Check if a folder with this name already exists in the same parent
         query = Folder.objects.filter(name=value, parent=parent)
         
@@ -96,6 +96,10 @@ class DocumentSerializer(serializers.ModelSerializer):
     
     def validate_name(self, value):
         """Validate document name uniqueness within a folder"""
+        # Unchanged name on update can't introduce a duplicate; skip the query
+        if self.instance is not None and self.instance.name == value:
+            return value
+
         folder = self.initial_data.get('folder')
         
         # Check if a document with this name already exists in the same folder
@@ -126,21 +130,29 @@ class BulkUploadSerializer(serializers.Serializer):
 
     def create(self, validated_data):
         """Create multiple Document instances for the uploaded files"""
+        from ..signals import documents_uploaded
+
         files = validated_data.pop('files')
         folder = validated_data.get('folder')
-        
-        documents = []
-        for file in files:
-            # Create a new document for each file
-            document = Document(
+
+        documents = [
+            Document(
                 name=file.name,
                 file=file,
                 folder=folder,
                 status='processing'  # Initial status
             )
-            document.save()  # Save to trigger signals
-            documents.append(document)
-        
+            for file in files
+        ]
+
+        # One INSERT per 500 rows; FileField.pre_save still writes each
+        # file to storage outside any transaction. bulk_create skips
+        # post_save, so the batch signal below hands the new rows to the
+        # ingestion pipeline.
+        with transaction.atomic():
+            Document.objects.bulk_create(documents, batch_size=500)
+        documents_uploaded.send(sender=Document, documents=documents)
+
         return documents
 
 class BulkDeleteSerializer(serializers.Serializer):
@@ -1,12 +1,17 @@
 # backend/dochub/api/views.py
 
 import logging
+import uuid
+from django.core.cache import cache
 from rest_framework import viewsets, status, parsers
 from rest_framework.decorators import action, api_view
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.db import transaction
+from django.db.models import Count
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
 
 from ..models import Folder, Document
 from .serializers import (
@@ -15,8 +20,12 @@ from .serializers import (
     BulkUploadSerializer,
     BulkDeleteSerializer
 )
-from ..pipeline.graphs.client import Neo4jClient
-from ..utils.graph_visualizer import GraphVisualizer
+from ..tasks.graph_tasks import (
+    build_document_graph,
+    build_folder_graph,
+    build_entity_graph,
+    graph_cache_key,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,52 +40,65 @@ def document_status(request, document_id=None):
     try:
         # Handle multiple document IDs in query parameter
         if document_id is None and 'ids' in request.query_params:
-            document_ids = request.query_params.get('ids', '').split(',')
-            document_ids = [doc_id.strip() for doc_id in document_ids if doc_id.strip()]
-            
+            # Single pass over the raw parameter: strip and drop empties
+            document_ids = [
+                s for s in map(str.strip, request.query_params.get('ids', '').split(','))
+                if s
+            ]
+
             if not document_ids:
                 return Response(
                     {"error": "No document IDs provided"},
                     status=status.HTTP_400_BAD_REQUEST
                 )
-            
-            # Get status for multiple documents
-            documents = Document.objects.filter(id__in=document_ids).values(
-                'id', 'name', 'status', 'error_message', 'updated_at'
-            )
-            
-            # Create a dictionary of document statuses
-            status_map = {
-                str(doc['id']): {
-                    'id': str(doc['id']),
-                    'name': doc['name'],
-                    'status': doc['status'],
-                    'error': doc['error_message'],
-                    'updated_at': doc['updated_at'].isoformat() if doc['updated_at'] else None
-                }
-                for doc in documents
-            }
-            
-            # Add missing IDs with 'not_found' status
+
+            # Keep each raw id alongside its parsed UUID; malformed values
+            # fall through to the not_found set difference below.
+            parsed = {}
             for doc_id in document_ids:
-                if doc_id not in status_map:
+                try:
+                    parsed[doc_id] = uuid.UUID(doc_id)
+                except ValueError:
+                    pass
+
+            documents = Document.objects.only(
+                'id', 'name', 'status', 'error_message', 'updated_at'
+            ).in_bulk(parsed.values())
+
+            status_map = {}
+            for doc_id, pk in parsed.items():
+                doc = documents.get(pk)
+                if doc is not None:
                     status_map[doc_id] = {
                         'id': doc_id,
-                        'status': 'not_found'
+                        'name': doc.name,
+                        'status': doc.status,
+                        'error': doc.error_message,
+                        'updated_at': doc.updated_at.isoformat() if doc.updated_at else None
                     }
-            
+
+            # C-level set difference covers malformed and unknown IDs alike
+            missing = set(document_ids) - status_map.keys()
+            status_map.update(
+                (doc_id, {'id': doc_id, 'status': 'not_found'}) for doc_id in missing
+            )
+
             return Response(status_map)
         
         # Handle single document ID in URL
         elif document_id is not None:
             try:
-                document = Document.objects.get(id=document_id)
+                # Project only the returned columns, mirroring the
+                # multi-document branch; skips model instantiation too.
+                document = Document.objects.values(
+                    'id', 'name', 'status', 'error_message', 'updated_at'
+                ).get(id=document_id)
                 return Response({
-                    'id': str(document.id),
-                    'name': document.name,
-                    'status': document.status,
-                    'error': document.error_message,
-                    'updated_at': document.updated_at.isoformat() if document.updated_at else None
+                    'id': str(document['id']),
+                    'name': document['name'],
+                    'status': document['status'],
+                    'error': document['error_message'],
+                    'updated_at': document['updated_at'].isoformat() if document['updated_at'] else None
                 })
             except Document.DoesNotExist:
                 return Response(
@@ -97,6 +119,11 @@ def document_status(request, document_id=None):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+# Folder reads are hot and change rarely; cache the rendered JSON for a
+# minute on the dedicated page-cache alias. Writes clear that alias via
+# the signal handlers in signals.py.
+@method_decorator(cache_page(60, cache='pages'), name='list')
+@method_decorator(cache_page(60, cache='pages'), name='retrieve')
 class FolderViewSet(viewsets.ModelViewSet):
     """
     API endpoints for folder management.
@@ -105,7 +132,10 @@ class FolderViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Get all folders, optionally filtered by parent."""
-        queryset = Folder.objects.all()
+        # Single aggregated query for both counts instead of two
+        # SELECT COUNT(*) round-trips per folder in the serializer.
+        # path is a materialized column, so no ancestor joins are needed.
+        queryset = Folder.objects.with_counts()
         
         # Filter by parent folder if specified
         parent = self.request.query_params.get('parent', None)
@@ -121,7 +151,9 @@ class FolderViewSet(viewsets.ModelViewSet):
     def documents(self, request, pk=None):
         """Get documents in a folder."""
         folder = self.get_object()
-        documents = Document.objects.filter(folder=folder)
+        # folder_path in the serializer reads document.folder.path (a
+        # materialized column); one join covers it.
+        documents = Document.objects.filter(folder=folder).select_related('folder')
         serializer = DocumentSerializer(documents, many=True, context={'request': request})
         return Response(serializer.data)
     
@@ -129,7 +161,7 @@ class FolderViewSet(viewsets.ModelViewSet):
     def subfolders(self, request, pk=None):
         """Get subfolders of a folder."""
         folder = self.get_object()
-        subfolders = Folder.objects.filter(parent=folder)
+        subfolders = self.get_queryset().filter(parent=folder)
         serializer = FolderSerializer(subfolders, many=True)
         return Response(serializer.data)
 
@@ -214,18 +246,21 @@ class BulkDeleteView(APIView):
             # Delete folders
             if folder_ids:
                 folders_to_delete = Folder.objects.filter(id__in=folder_ids)
-                deleted_folders = folders_to_delete.count()
-                for folder in folders_to_delete:
-                    logger.info(f"Deleting folder: {folder.id} - {folder.name}")
-                folders_to_delete.delete()
-            
+                # Raw (id, name) tuples for the log; avoids hydrating a
+                # model instance per row just to format a message.
+                logger.info("Deleting folders: %s", list(folders_to_delete.values_list('id', 'name')))
+                # delete() already reports what it removed, per model;
+                # no separate COUNT query needed. The total also covers
+                # cascaded rows, so read the per-model figure.
+                _, deleted_by_model = folders_to_delete.delete()
+                deleted_folders = deleted_by_model.get('dochub.Folder', 0)
+
             # Delete documents
             if document_ids:
                 documents_to_delete = Document.objects.filter(id__in=document_ids)
-                deleted_documents = documents_to_delete.count()
-                for document in documents_to_delete:
-                    logger.info(f"Deleting document: {document.id} - {document.name}")
-                documents_to_delete.delete()
+                logger.info("Deleting documents: %s", list(documents_to_delete.values_list('id', 'name')))
+                _, deleted_by_model = documents_to_delete.delete()
+                deleted_documents = deleted_by_model.get('dochub.Document', 0)
         
         return Response({
             "deleted_folders": deleted_folders,
@@ -236,69 +271,23 @@ class BulkDeleteView(APIView):
 
 def document_graph(request, document_id):
     """Get knowledge graph for a document"""
-    try:
-        document = Document.objects.get(id=document_id)
-    except Document.DoesNotExist:
+    # Only existence matters here; don't hydrate the full row
+    if not Document.objects.filter(id=document_id).exists():
         return Response({"error": "Document not found"}, status=status.HTTP_404_NOT_FOUND)
     
     try:
-        # Initialize Neo4j client
-        neo4j_client = Neo4jClient()
-        
-        # Retrieve graph data
-        graph_records = neo4j_client.get_document_graph(document_id)
-        
-        # Process records into JSON-compatible format
-        nodes = {}
-        relationships = {}
-        
-        for record in graph_records:
-            # Extract path data
-            path = record["path"]
-            
-            # Process nodes
-            for node in path.nodes:
-                if node.id not in nodes:
-                    nodes[node.id] = {
-                        "id": str(node.id),
-                        "labels": list(node.labels),
-                        "properties": dict(node)
-                    }
-            
-            # Process relationships
-            for rel in path.relationships:
-                if rel.id not in relationships:
-                    relationships[rel.id] = {
-                        "id": str(rel.id),
-                        "type": rel.type,
-                        "start_node": str(rel.start_node.id),
-                        "end_node": str(rel.end_node.id),
-                        "properties": dict(rel)
-                    }
-        
-        # Use the GraphVisualizer to format the data
-        raw_graph_data = {
-            "nodes": list(nodes.values()),
-            "relationships": list(relationships.values())
-        }
-        
         # Check if we need 2D or 3D format
         format_type = request.query_params.get('format', '2d').lower()
-        
-        # Process using GraphVisualizer
-        processed_data = GraphVisualizer.process_neo4j_graph(
-            raw_graph_data["nodes"], 
-            raw_graph_data["relationships"]
-        )
-        
-        # Convert to appropriate format for react-force-graph
-        if format_type == '3d':
-            graph_data = GraphVisualizer.to_force_graph_3d_format(processed_data)
-        else:
-            graph_data = GraphVisualizer.to_force_graph_format(processed_data)
-        
+
+        # Served from cache once a worker has built the payload; cold
+        # requests queue the build and return 202 so clients re-poll.
+        graph_data = cache.get(graph_cache_key('document', document_id, format_type))
+        if graph_data is None:
+            build_document_graph.delay(str(document_id), format_type)
+            return Response({"status": "pending"}, status=status.HTTP_202_ACCEPTED)
+
         return Response(graph_data)
-        
+
     except Exception as e:
         logger.error(f"Error retrieving graph data: {e}")
         return Response(
@@ -309,72 +298,29 @@ def document_graph(request, document_id):
 
 def folder_graph(request, folder_id):
     """Get knowledge graph for documents in a folder"""
-    try:
-        folder = Folder.objects.get(id=folder_id)
-    except Folder.DoesNotExist:
+    # One projected query gives existence, name and document count
+    folder = Folder.objects.filter(id=folder_id).values('id', 'name').annotate(
+        num_documents=Count('documents')
+    ).first()
+    if folder is None:
         return Response({"error": "Folder not found"}, status=status.HTTP_404_NOT_FOUND)
     
     try:
-        # Initialize Neo4j client
-        neo4j_client = Neo4jClient()
-        
-        # Retrieve graph data
-        graph_records = neo4j_client.get_folder_graph(folder_id=folder_id)
-        
-        # Process records into JSON-compatible format
-        nodes = {}
-        relationships = {}
-        
-        for record in graph_records:
-            # Extract path data
-            path = record["path"]
-            
-            # Process nodes
-            for node in path.nodes:
-                if node.id not in nodes:
-                    nodes[node.id] = {
-                        "id": str(node.id),
-                        "labels": list(node.labels),
-                        "properties": dict(node)
-                    }
-            
-            # Process relationships
-            for rel in path.relationships:
-                if rel.id not in relationships:
-                    relationships[rel.id] = {
-                        "id": str(rel.id),
-                        "type": rel.type,
-                        "start_node": str(rel.start_node.id),
-                        "end_node": str(rel.end_node.id),
-                        "properties": dict(rel)
-                    }
-        
-        # Use the GraphVisualizer to format the data
-        raw_graph_data = {
-            "nodes": list(nodes.values()),
-            "relationships": list(relationships.values())
-        }
-        
         # Check if we need 2D or 3D format
         format_type = request.query_params.get('format', '2d').lower()
-        
-        # Process using GraphVisualizer
-        processed_data = GraphVisualizer.process_neo4j_graph(
-            raw_graph_data["nodes"], 
-            raw_graph_data["relationships"]
-        )
-        
-        # Convert to appropriate format for react-force-graph
-        if format_type == '3d':
-            graph_data = GraphVisualizer.to_force_graph_3d_format(processed_data)
-        else:
-            graph_data = GraphVisualizer.to_force_graph_format(processed_data)
-            
+
+        # Served from cache once a worker has built the payload; cold
+        # requests queue the build and return 202 so clients re-poll.
+        graph_data = cache.get(graph_cache_key('folder', folder_id, format_type))
+        if graph_data is None:
+            build_folder_graph.delay(str(folder_id), format_type)
+            return Response({"status": "pending"}, status=status.HTTP_202_ACCEPTED)
+
         # Add folder information to the response
         graph_data["folder"] = {
-            "id": str(folder.id),
-            "name": folder.name,
-            "document_count": Document.objects.filter(folder=folder).count()
+            "id": str(folder['id']),
+            "name": folder['name'],
+            "document_count": folder['num_documents']
         }
         
         return Response(graph_data)
@@ -396,78 +342,22 @@ def entity_graph(request):
         return Response({"error": "Entity name is required"}, status=status.HTTP_400_BAD_REQUEST)
     
     try:
-        # Initialize Neo4j client
-        neo4j_client = Neo4jClient()
-        
-        # Retrieve graph data
-        graph_records = neo4j_client.get_entity_relationships(entity_name, entity_type)
-        
-        # Process records into JSON-compatible format
-        nodes = {}
-        relationships = {}
-        
-        for record in graph_records:
-            # Extract entities and relationship
-            entity = record["e"]
-            relation = record["r"]
-            related = record["related"]
-            
-            # Process entity node
-            entity_id = entity.id
-            if entity_id not in nodes:
-                nodes[entity_id] = {
-                    "id": str(entity_id),
-                    "labels": list(entity.labels),
-                    "properties": dict(entity)
-                }
-            
-            # Process related node
-            related_id = related.id
-            if related_id not in nodes:
-                nodes[related_id] = {
-                    "id": str(related_id),
-                    "labels": list(related.labels),
-                    "properties": dict(related)
-                }
-            
-            # Process relationship
-            rel_id = relation.id
-            if rel_id not in relationships:
-                relationships[rel_id] = {
-                    "id": str(rel_id),
-                    "type": relation.type,
-                    "start_node": str(relation.start_node.id),
-                    "end_node": str(relation.end_node.id),
-                    "properties": dict(relation)
-                }
-        
-        # Use the GraphVisualizer to format the data
-        raw_graph_data = {
-            "nodes": list(nodes.values()),
-            "relationships": list(relationships.values())
-        }
-        
         # Check if we need 2D or 3D format
         format_type = request.query_params.get('format', '2d').lower()
-        
-        # Process using GraphVisualizer
-        processed_data = GraphVisualizer.process_neo4j_graph(
-            raw_graph_data["nodes"], 
-            raw_graph_data["relationships"]
-        )
-        
-        # Convert to appropriate format for react-force-graph
-        if format_type == '3d':
-            graph_data = GraphVisualizer.to_force_graph_3d_format(processed_data)
-        else:
-            graph_data = GraphVisualizer.to_force_graph_format(processed_data)
-            
+
+        # Served from cache once a worker has built the payload; cold
+        # requests queue the build and return 202 so clients re-poll.
+        graph_data = cache.get(graph_cache_key('entity', f"{entity_name}:{entity_type}", format_type))
+        if graph_data is None:
+            build_entity_graph.delay(entity_name, entity_type, format_type)
+            return Response({"status": "pending"}, status=status.HTTP_202_ACCEPTED)
+
         # Add entity information to the response
         graph_data["entity"] = {
             "name": entity_name,
             "type": entity_type,
-            "node_count": len(nodes),
-            "relationship_count": len(relationships)
+            "node_count": len(graph_data.get("nodes", [])),
+            "relationship_count": len(graph_data.get("links", graph_data.get("relationships", [])))
         }
         
         return Response(graph_data)
@@ -7,6 +7,9 @@ from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+# Commands whose startup should trigger media-structure initialization
+_SERVER_CMDS = frozenset(('runserver', 'uvicorn', 'daphne'))
+
 class DochubConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'dochub'
@@ -19,7 +22,7 @@ class DochubConfig(AppConfig):
         
         # Don't run initialization during migrations or other management commands
         import sys
-        if 'runserver' in sys.argv or 'uvicorn' in sys.argv or 'daphne' in sys.argv:
+        if _SERVER_CMDS.intersection(sys.argv):
             # Use try/except to avoid issues if this runs before migrations
             try:
                 self.ensure_media_structure()
@@ -28,18 +31,24 @@ class DochubConfig(AppConfig):
     
     def ensure_media_structure(self):
         """Ensure the media structure exists."""
+        # A sentinel file marks a completed initialization so autoreload
+        # cycles and worker boots skip the database round-trip entirely.
+        sentinel = os.path.join(settings.MEDIA_ROOT, '.dochub_initialized')
+        if os.path.exists(sentinel):
+            return
+
         # Create the media root if it doesn't exist
         os.makedirs(settings.MEDIA_ROOT, exist_ok=True)
-        
+
         # Create Documents root directory
         documents_root = os.path.join(settings.MEDIA_ROOT, 'Documents')
         if not os.path.exists(documents_root):
             os.makedirs(documents_root)
             logger.info(f"Created Documents root directory at: {documents_root}")
-        
+
         # Create root folder in database
         from .models import Folder
-        
+
         # Try to find or create the Documents root folder
         root_folder, created = Folder.objects.get_or_create(
             name="Documents",
@@ -49,8 +58,12 @@ class DochubConfig(AppConfig):
                 'parent': None
             }
         )
-        
+
         if created:
             logger.info(f"Created root folder 'Documents' with ID: {root_folder.id}")
         else:
-            logger.info(f"Root folder 'Documents' already exists with ID: {root_folder.id}")
\ No newline at end of file
+            logger.info(f"Root folder 'Documents' already exists with ID: {root_folder.id}")
+
+        # Only written after everything above succeeded
+        with open(sentinel, 'w') as f:
+            f.write('')
\ No newline at end of file
@@ -4,7 +4,6 @@ import os
 import time
 import logging
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
 from django.conf import settings
 
 from dochub.models import Document
@@ -60,7 +59,9 @@ class Command(BaseCommand):
         try:
             # Get document
             try:
-                document = Document.objects.get(id=document_id)
+                # JOIN the folder row up front; process_document reads
+                # document.folder and document.folder_path
+                document = Document.objects.select_related('folder').get(id=document_id)
                 self.stdout.write(f"Testing pipeline with document: {document.name} (ID: {document_id})")
             except Document.DoesNotExist:
                 raise CommandError(f"Document with ID {document_id} does not exist")
@@ -74,11 +75,9 @@ class Command(BaseCommand):
             # Create a custom document service with the logger
             service = InstrumentedDocumentService(logger=logger, openai_model=openai_model)
             
-            # Update document status to processing
-            with transaction.atomic():
-                document.status = 'processing'
-                document.error_message = None
-                document.save(update_fields=['status', 'error_message'])
+            # Update document status to processing; a single UPDATE
+            # statement needs no explicit transaction or reload
+            Document.objects.filter(id=document_id).update(status='processing', error_message=None)
             
             # Start testing
             self.stdout.write("Starting pipeline test...")
@@ -91,10 +90,7 @@ class Command(BaseCommand):
                 result = service.process_document(document)
                 
                 # Update document status to ready
-                with transaction.atomic():
-                    document = Document.objects.get(id=document_id)
-                    document.status = 'ready'
-                    document.save(update_fields=['status'])
+                Document.objects.filter(id=document_id).update(status='ready')
                 
                 logger.end_pipeline()
                 
@@ -112,11 +108,7 @@ class Command(BaseCommand):
                 
             except Exception as e:
                 # Update document status to error
-                with transaction.atomic():
-                    document = Document.objects.get(id=document_id)
-                    document.status = 'error'
-                    document.error_message = str(e)
-                    document.save(update_fields=['status', 'error_message'])
+                Document.objects.filter(id=document_id).update(status='error', error_message=str(e))
                 
                 logger.log(f"Pipeline test failed: {str(e)}", logging.ERROR)
                 logger.end_pipeline()
@@ -141,11 +133,33 @@ class InstrumentedDocumentService(DocumentService):
         if hasattr(self.graph_generator, 'schema') and hasattr(self.graph_generator.schema, 'get'):
             extraction_config = self.graph_generator.schema.get('extraction_config', {})
             extraction_config['model'] = openai_model
-    
+
+        # Wrap entity extraction once here; the old per-call monkey-patch
+        # leaked its wrapper on exceptions and stacked a new layer per run
+        if logger is not None:
+            self._orig_extract = self.graph_generator.extract_entities_and_relations_openai
+            self.graph_generator.extract_entities_and_relations_openai = self._logged_extract
+
     @property
     def has_logger(self):
         """Check if logger is available"""
         return self.logger is not None
+
+    def _logged_extract(self, *args, **kwargs):
+        """Log OpenAI I/O around the graph generator's entity extraction"""
+        # Log the prompt
+        text_to_extract = args[0] if args else kwargs.get('text', '')
+        self.logger.log_openai_request(text_to_extract[:1000] + "..." if len(text_to_extract) > 1000 else text_to_extract)
+
+        # Call original method
+        result = self._orig_extract(*args, **kwargs)
+
+        # Log the response
+        entities = result.get('entities', [])
+        relationships = result.get('relationships', [])
+        self.logger.log_graph_data(entities, relationships)
+
+        return result
     
     def process_document(self, document):
         """Process document with logging"""
@@ -208,30 +222,10 @@ class InstrumentedDocumentService(DocumentService):
             self.logger.log(f"Indexing {len(chunks)} chunks in vector database")
             chunk_ids = self.logger.log_step("index_chunks")(self.indexer.index)(chunks, embeddings, metadata)
             
-            # STEP 5: Generate knowledge graph
+            # STEP 5: Generate knowledge graph (entity extraction is
+            # already wrapped for logging in __init__)
             self.logger.log(f"Generating knowledge graph for document using model: {self.openai_model}")
-            
-            # Override the extract_entities_and_relations_openai method to log OpenAI I/O
-            original_extract = self.graph_generator.extract_entities_and_relations_openai
-            
-            def logged_extract(*args, **kwargs):
-                # Log the prompt
-                text_to_extract = args[0] if args else kwargs.get('text', '')
-                self.logger.log_openai_request(text_to_extract[:1000] + "..." if len(text_to_extract) > 1000 else text_to_extract)
-                
-                # Call original method
-                result = original_extract(*args, **kwargs)
-                
-                # Log the response
-                entities = result.get('entities', [])
-                relationships = result.get('relationships', [])
-                self.logger.log_graph_data(entities, relationships)
-                
-                return result
-                
-            # Replace the method temporarily
-            self.graph_generator.extract_entities_and_relations_openai = logged_extract
-            
+
             # Default user ID (can be made configurable in the future)
             user_id = "system"  # or get from document owner if you implement authentication
             
@@ -250,10 +244,7 @@ class InstrumentedDocumentService(DocumentService):
                 metadata=metadata,
                 chunks=chunks
             )
-            
-            # Restore original method
-            self.graph_generator.extract_entities_and_relations_openai = original_extract
-            
+
             self.logger.log(f"Document {document_id} processed successfully")
             
             return {
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.2
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dochub', '0002_alter_document_options_alter_folder_options'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='document',
+            name='name',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='folder',
+            name='name',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+    ]
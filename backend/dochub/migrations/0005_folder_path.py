@@ -0,0 +1,41 @@
+# Generated by Django 5.0.2
+
+import os
+
+from django.db import migrations, models
+
+
+def populate_folder_paths(apps, schema_editor):
+    """Backfill the materialized path column from the parent hierarchy."""
+    Folder = apps.get_model('dochub', 'Folder')
+    folders = {folder.pk: folder for folder in Folder.objects.all()}
+
+    def path_of(folder):
+        parts = []
+        current = folder
+        while current:
+            parts.insert(0, current.name)
+            current = folders.get(current.parent_id)
+        if not parts or parts[0] != "Documents":
+            parts.insert(0, "Documents")
+        return os.path.join(*parts)
+
+    for folder in folders.values():
+        folder.path = path_of(folder)
+    Folder.objects.bulk_update(folders.values(), ['path'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dochub', '0004_document_folder_status_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='folder',
+            name='path',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=2048),
+        ),
+        migrations.RunPython(populate_folder_paths, migrations.RunPython.noop),
+    ]
@@ -3,7 +3,7 @@
 import uuid
 import os
 from django.db import models
-from .folder import Folder, build_folder_path
+from .folder import Folder
 
 def document_upload_path(instance, filename):
     """
@@ -20,9 +20,8 @@ def document_upload_path(instance, filename):
         str: Path where the file should be stored
     """
     if instance.folder:
-        # Get folder path
-        folder_path = build_folder_path(instance.folder)
-        return os.path.join(folder_path, filename)
+        # Materialized path column: a field read, no ancestry walk
+        return os.path.join(instance.folder.path, filename)
     else:
         # Root level document goes directly in Documents folder
         return os.path.join("Documents", filename)
@@ -36,7 +35,7 @@ class Document(models.Model):
     )
     
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    name = models.CharField(max_length=255)
+    name = models.CharField(max_length=255, db_index=True)
     file = models.FileField(upload_to=document_upload_path)
     folder = models.ForeignKey(
         Folder, 
@@ -65,6 +64,15 @@ class Document(models.Model):
         ordering = ['-created_at']
         verbose_name = "Document"
         verbose_name_plural = "Documents"
+        indexes = [
+            # Serves folder-scoped status filters in the list views; the
+            # single-column folder index comes free with the ForeignKey.
+            models.Index(fields=['folder', 'status'], name='doc_folder_status_idx'),
+            # Background workers scan for status='processing'
+            models.Index(fields=['status'], name='doc_status_idx'),
+            # Folder listings order by -created_at (the model default)
+            models.Index(fields=['folder', '-created_at'], name='doc_folder_created_idx'),
+        ]
     
     @property
     def is_processed(self):
@@ -87,5 +95,5 @@ class Document(models.Model):
     def folder_path(self):
         """Get the folder path for the document"""
         if self.folder:
-            return build_folder_path(self.folder)
+            return self.folder.path
         return "Documents"
\ No newline at end of file
@@ -2,51 +2,87 @@
 
 import uuid
 import os
-from django.db import models
+from django.db import connection, models
+from django.db.models import Count
 from django.conf import settings
 
 def build_folder_path(folder):
     """
-    Recursively build the folder path based on hierarchy.
+    Get the folder path based on hierarchy.
     Always starts with Documents/
-    
+
     Args:
         folder: Folder instance
-        
+
     Returns:
         str: Path for the folder (e.g., "Documents/FolderA/SubfolderB")
     """
+    # The materialized path column makes this a plain field read for
+    # saved folders; the walk only covers unsaved instances.
+    if folder.path:
+        return folder.path
+
+    # append + one reverse: insert(0, ...) shifts the list every
+    # iteration, turning deep trees quadratic
     parts = []
     current = folder
-    
-    # Build path starting from the deepest folder
     while current:
-        parts.insert(0, current.name)
+        parts.append(current.name)
         current = current.parent
-    
+    parts.reverse()
+
     # Ensure it starts with Documents if not already
     if not parts or parts[0] != "Documents":
         parts.insert(0, "Documents")
-        
+
     return os.path.join(*parts)
 
+class FolderManager(models.Manager):
+    """Manager with queryset helpers for the Folder model"""
+
+    def with_counts(self):
+        """
+        Annotate document and subfolder counts onto each folder so the
+        count properties read from the row instead of issuing their own
+        SELECT COUNT(*) queries.
+        """
+        return self.annotate(
+            num_documents=Count('documents', distinct=True),
+            num_subfolders=Count('subfolders', distinct=True)
+        )
+
 class Folder(models.Model):
     """Folder model for organizing documents"""
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    name = models.CharField(max_length=255)
+    name = models.CharField(max_length=255, db_index=True)
     parent = models.ForeignKey(
-        'self', 
-        on_delete=models.CASCADE, 
-        null=True, 
-        blank=True, 
+        'self',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
         related_name='subfolders'
     )
+    # Materialized path ("Documents/FolderA/SubfolderB"), maintained in
+    # save() and cascaded to descendants on rename/move via signals, so
+    # reading a path never walks the ancestry at runtime.
+    path = models.CharField(max_length=2048, db_index=True, editable=False, blank=True, default='')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = FolderManager()
+
     def __str__(self):
         """String representation of the folder"""
         return self.name
+
+    def save(self, *args, **kwargs):
+        if self.parent_id:
+            self.path = os.path.join(self.parent.path, self.name)
+        elif self.name != "Documents":
+            self.path = os.path.join("Documents", self.name)
+        else:
+            self.path = self.name
+        super().save(*args, **kwargs)
     
     class Meta:
         """Meta options for the Folder model"""
@@ -54,19 +90,20 @@ class Folder(models.Model):
         verbose_name = "Folder"
         verbose_name_plural = "Folders"
     
-    @property
-    def path(self):
-        """Get the full path of the folder"""
-        return build_folder_path(self)
-    
     @property
     def document_count(self):
         """Get the number of documents in this folder"""
+        # Prefer the with_counts() annotation when present
+        if hasattr(self, 'num_documents'):
+            return self.num_documents
         return self.documents.count()
-    
+
     @property
     def subfolder_count(self):
         """Get the number of subfolders in this folder"""
+        # Prefer the with_counts() annotation when present
+        if hasattr(self, 'num_subfolders'):
+            return self.num_subfolders
         return self.subfolders.count()
     
     @property
@@ -84,13 +121,41 @@ class Folder(models.Model):
         ancestors = []
         current = self.parent
         while current:
-            ancestors.insert(0, current)
+            ancestors.append(current)
             current = current.parent
+        ancestors.reverse()
         return ancestors
     
+    @classmethod
+    def descendants_of(cls, folder_id):
+        """
+        Get every descendant folder in a single recursive query.
+
+        Args:
+            folder_id: Folder primary key
+
+        Returns:
+            list: Descendant Folder instances
+        """
+        # Convert the id the same way the ORM would: SQLite stores
+        # UUIDField as dash-less char(32), so a raw str(uuid) parameter
+        # would never match a row there.
+        pk_param = cls._meta.pk.get_db_prep_value(folder_id, connection)
+        return list(cls.objects.raw(
+            """
+            WITH RECURSIVE descendants AS (
+                SELECT * FROM dochub_folder WHERE parent_id = %s
+                UNION ALL
+                SELECT f.* FROM dochub_folder f
+                JOIN descendants d ON f.parent_id = d.id
+            )
+            SELECT * FROM descendants
+            """,
+            [pk_param]
+        ))
+
     def get_descendants(self):
-        """Get all descendant folders (recursively)"""
-        descendants = list(self.subfolders.all())
-        for child in self.subfolders.all():
-            descendants.extend(child.get_descendants())
-        return descendants
\ No newline at end of file
+        """Get all descendant folders"""
+        # One CTE round-trip instead of a pair of subfolder queries per
+        # node per level
+        return self.descendants_of(self.pk)
\ No newline at end of file
@@ -1,29 +1,79 @@
 import os
+import asyncio
 import logging
-import random
+from functools import lru_cache
 import numpy as np
+import tiktoken
+from blake3 import blake3
 from django.conf import settings
+from django.core.cache import cache
 from .base import EmbeddingGenerator
 import openai  # Using module-level API
 
 logger = logging.getLogger(__name__)
 
+# OpenAI embedding models reject inputs above this many tokens
+MAX_EMBEDDING_TOKENS = 8191
+
+@lru_cache(maxsize=None)
+def _get_encoding(model_name):
+    """Get the tiktoken encoding for a model, shared process-wide."""
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
 class OpenAIEmbeddingGenerator(EmbeddingGenerator):
     """Embedding generator implementation using OpenAI API"""
     
-    def __init__(self, model="text-embedding-ada-002", batch_size=100):
+    def __init__(self, model="text-embedding-ada-002", batch_size=100, concurrency=4):
         """
         Initialize the OpenAI embedding generator.
-        
+
         Args:
             model: OpenAI embedding model name.
             batch_size: Number of chunks to process in one batch.
+            concurrency: Maximum number of in-flight embedding requests.
         """
         self.model_name = model
         self.batch_size = batch_size
+        self.concurrency = concurrency
         self.testing = getattr(settings, 'USE_MOCK_EMBEDDINGS', False)
+        self._client = None
         if self.testing:
             logger.info("Using MOCK embeddings for testing")
+
+    def _get_api_key(self):
+        """Get the OpenAI API key, raising if it is not configured."""
+        api_key = os.getenv("OPENAI_API_KEY") or getattr(settings, "OPENAI_API_KEY", None)
+        if not api_key:
+            logger.error("Missing OPENAI_API_KEY environment variable or setting")
+            raise ValueError("Missing OPENAI_API_KEY environment variable or setting")
+        return api_key
+
+    def _get_client(self):
+        """
+        Get the shared OpenAI client, creating it on first use.
+
+        One client per generator reuses its pooled HTTP connections
+        across batches instead of paying a TLS handshake per request.
+        """
+        if self._client is None:
+            self._client = openai.OpenAI(api_key=self._get_api_key())
+        return self._client
+
+    def _truncate_chunk(self, chunk):
+        """Truncate a chunk to the model's token limit to avoid 400 errors."""
+        encoding = _get_encoding(self.model_name)
+        tokens = encoding.encode(chunk)
+        if len(tokens) <= MAX_EMBEDDING_TOKENS:
+            return chunk
+        logger.warning(f"Truncating chunk from {len(tokens)} to {MAX_EMBEDDING_TOKENS} tokens")
+        return encoding.decode(tokens[:MAX_EMBEDDING_TOKENS])
+
+    def _prepare_batch(self, batch):
+        """Tokenize-and-truncate a batch; CPU work run off the event loop."""
+        return [self._truncate_chunk(chunk) for chunk in batch]
     
     def generate(self, chunks):
         """
@@ -38,51 +88,152 @@ class OpenAIEmbeddingGenerator(EmbeddingGenerator):
         if not chunks:
             logger.warning("No chunks provided for embedding generation")
             return []
+
+        # Byte-identical chunks (re-ingests, overlapping corpora) resolve
+        # from the cache; only unseen text goes to the API.
+        keys = [self._cache_key(chunk) for chunk in chunks]
+        cached = cache.get_many(keys)
+        missing_idx = [i for i, key in enumerate(keys) if key not in cached]
+
+        if missing_idx:
+            missing_chunks = [chunks[i] for i in missing_idx]
+            if self.testing:
+                new_embeddings = self._generate_mock_embeddings(missing_chunks)
+            else:
+                new_embeddings = self._generate_real_embeddings(missing_chunks)
+            # Cache only real embeddings: a None from the per-chunk retry
+            # path means the API failed, and permanently caching its zero
+            # stand-in would poison every future ingest of that content.
+            new_entries = {}
+            failed_entries = {}
+            for i, embedding in zip(missing_idx, new_embeddings):
+                if embedding is None:
+                    failed_entries[keys[i]] = np.zeros(1536, dtype=np.float16)
+                else:
+                    new_entries[keys[i]] = embedding
+            if new_entries:
+                cache.set_many(new_entries, timeout=None)
+            # Real vectors win if a duplicated chunk both failed and
+            # succeeded in the same batch
+            cached.update(failed_entries)
+            cached.update(new_entries)
+        else:
+            logger.info(f"All {len(chunks)} embeddings served from cache")
+
+        return [cached[key] for key in keys]
+
+    def _cache_key(self, chunk):
+        """Cache key for a chunk's embedding: content hash plus model name."""
+        # blake3 hashes several times faster than sha256 on large chunks
+        digest = blake3(chunk.encode()).hexdigest()
         if self.testing:
-            return self._generate_mock_embeddings(chunks)
-        return self._generate_real_embeddings(chunks)
+            # Mock vectors live in their own namespace: a test run against
+            # the shared cache must never overwrite real embeddings, nor
+            # may a later real run be served random mock vectors.
+            return f"embedding:mock:{digest}:{self.model_name}"
+        return f"embedding:{digest}:{self.model_name}"
     
     def _generate_mock_embeddings(self, chunks):
         logger.info(f"Generating mock embeddings for {len(chunks)} chunks")
-        mock_embeddings = []
-        for chunk in chunks:
-            seed = hash(chunk) % 10000
-            random.seed(seed)
-            embedding = [random.uniform(-1, 1) for _ in range(1536)]
-            norm = np.sqrt(sum(x * x for x in embedding))
-            embedding = [x / norm for x in embedding]
-            mock_embeddings.append(embedding)
+        # Fill one contiguous array row-per-chunk (seeded per chunk so the
+        # vectors stay deterministic), then normalize the whole batch with
+        # a single vectorized norm instead of Python-level loops.
+        out = np.empty((len(chunks), 1536), dtype=np.float64)
+        for row, chunk in enumerate(chunks):
+            # blake3-derived seed: deterministic across processes, unlike
+            # the salted built-in hash()
+            seed = int.from_bytes(blake3(chunk.encode()).digest()[:4], 'little')
+            rng = np.random.default_rng(seed)
+            out[row] = rng.uniform(-1, 1, 1536)
+        out /= np.linalg.norm(out, axis=1, keepdims=True)
+        # Same float16 representation as the real path
+        mock_embeddings = list(out.astype(np.float16))
         logger.info(f"Successfully generated {len(mock_embeddings)} mock embeddings")
         return mock_embeddings
     
+    async def _embed_batches_async(self, batches, api_key):
+        """
+        Fan out batch requests concurrently, bounded by a semaphore.
+
+        Args:
+            batches: List of chunk batches.
+            api_key: OpenAI API key.
+
+        Returns:
+            list: One response (or exception) per batch, in batch order.
+        """
+        client = openai.AsyncOpenAI(api_key=api_key)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        loop = asyncio.get_running_loop()
+
+        async def embed_one(raw_batch):
+            async with semaphore:
+                # Tokenization runs in the thread pool, so preparing one
+                # batch overlaps with the API calls already in flight
+                # instead of serializing prep before submission.
+                batch = await loop.run_in_executor(None, self._prepare_batch, raw_batch)
+                return await client.embeddings.create(
+                    input=batch,
+                    model=self.model_name
+                )
+
+        try:
+            # return_exceptions keeps one failed batch from discarding the
+            # rest; failures are retried per chunk by the caller.
+            return await asyncio.gather(
+                *(embed_one(batch) for batch in batches),
+                return_exceptions=True
+            )
+        finally:
+            await client.close()
+
     def _generate_real_embeddings(self, chunks):
-        openai_api_key = os.getenv("OPENAI_API_KEY") or getattr(settings, "OPENAI_API_KEY", None)
-        if not openai_api_key:
-            logger.error("Missing OPENAI_API_KEY environment variable or setting")
-            raise ValueError("Missing OPENAI_API_KEY environment variable or setting")
+        openai_api_key = self._get_api_key()
         try:
-            logger.info("Using OpenAI module-level API to generate embeddings")
-            openai.api_key = openai_api_key
-            # Do not set any proxies here
-            
             logger.info(f"Generating OpenAI embeddings for {len(chunks)} chunks using {self.model_name}")
+            # Raw slices; each batch is tokenized/truncated inside the
+            # async fan-out, overlapped with in-flight requests
+            batches = [
+                chunks[i:i + self.batch_size]
+                for i in range(0, len(chunks), self.batch_size)
+            ]
+
+            # Up to self.concurrency batches are in flight at once, so total
+            # time approaches the slowest batch rather than the sum of all.
+            responses = asyncio.run(self._embed_batches_async(batches, openai_api_key))
+
             all_embeddings = []
-            for i in range(0, len(chunks), self.batch_size):
-                batch = chunks[i:i + self.batch_size]
-                for chunk in batch:
-                    try:
-                        response = openai.embeddings.create(
-                            input=chunk,
-                            model=self.model_name
-                        )
-                        # Access using attribute access (Pydantic model)
-                        embedding = response.data[0].embedding
-                        all_embeddings.append(embedding)
-                        logger.debug(f"Generated embedding for chunk with {len(embedding)} dimensions")
-                    except Exception as chunk_error:
-                        logger.error(f"Error generating embedding for chunk: {str(chunk_error)}")
-                        all_embeddings.append([0.0] * 1536)
-                logger.debug(f"Processed batch {i // self.batch_size + 1}/{(len(chunks) - 1) // self.batch_size + 1}")
+            for batch, response in zip(batches, responses):
+                if isinstance(response, Exception):
+                    # Retry chunk-by-chunk so one bad input doesn't poison
+                    # the whole batch.
+                    logger.error(f"Batch embedding request failed, retrying per chunk: {str(response)}")
+                    for chunk in batch:
+                        try:
+                            retry = self._get_client().embeddings.create(
+                                input=self._truncate_chunk(chunk),
+                                model=self.model_name
+                            )
+                            # Access using attribute access (Pydantic model)
+                            all_embeddings.append(
+                                np.asarray(retry.data[0].embedding, dtype=np.float16)
+                            )
+                        except Exception as chunk_error:
+                            logger.error(f"Error generating embedding for chunk: {str(chunk_error)}")
+                            # None marks the failure; generate() serves a
+                            # zero vector for this run but keeps it out of
+                            # the permanent cache so the chunk is retried
+                            # on the next ingest.
+                            all_embeddings.append(None)
+                else:
+                    # Sort by index to guarantee input order; float16 rows
+                    # cost 3KB per vector instead of ~36KB of Python float
+                    # objects, cutting cache and index payloads ~12x.
+                    vecs = np.asarray(
+                        [item.embedding for item in sorted(response.data, key=lambda d: d.index)],
+                        dtype=np.float32
+                    ).astype(np.float16)
+                    all_embeddings.extend(vecs)
             if len(all_embeddings) != len(chunks):
                 logger.warning(f"Mismatch between chunks ({len(chunks)}) and embeddings ({len(all_embeddings)})")
                 raise ValueError(f"Got {len(all_embeddings)} embeddings for {len(chunks)} chunks")
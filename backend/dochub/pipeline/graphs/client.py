@@ -367,6 +367,50 @@ class Neo4jClient:
                                         details={"error": error_msg})
             return []
     
+    def get_document_graph_elements(self, document_id: str) -> Dict[str, List]:
+        """
+        Get deduplicated graph elements for a document.
+
+        Deduplication happens in Cypher via collect(DISTINCT ...), so
+        callers can serialize the returned lists without maintaining
+        their own node/relationship dicts.
+
+        Args:
+            document_id: Document UUID
+
+        Returns:
+            Dict with unique 'nodes' and 'relationships' lists
+        """
+        try:
+            self.pipeline_logger.log_step(document_id, "neo4j_get_document_graph", "started")
+
+            with self.driver.session() as session:
+                result = session.run("""
+                    MATCH path = (e1)-[r]-(e2)
+                    WHERE r.document_id = $document_id
+                    UNWIND nodes(path) AS n
+                    WITH collect(DISTINCT n) AS ns, collect(DISTINCT r) AS rs
+                    RETURN ns AS nodes, rs AS relationships
+                """, document_id=str(document_id))
+
+                record = result.single()
+                elements = {
+                    "nodes": record["nodes"] if record else [],
+                    "relationships": record["relationships"] if record else []
+                }
+
+                self.pipeline_logger.log_step(document_id, "neo4j_get_document_graph", "completed",
+                                            details={"node_count": len(elements["nodes"]),
+                                                    "relationship_count": len(elements["relationships"])})
+
+                return elements
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"Error getting document graph: {error_msg}")
+            self.pipeline_logger.log_step(document_id, "neo4j_get_document_graph", "error",
+                                        details={"error": error_msg})
+            return {"nodes": [], "relationships": []}
+
     def get_folder_graph(self, folder_id: str) -> List[Dict]:
         """
         Get graph data for documents in a folder.
@@ -416,6 +460,103 @@ class Neo4jClient:
                                         details={"error": error_msg})
             return []
     
+    def get_folder_graph_elements(self, folder_id: str) -> Dict[str, List]:
+        """
+        Get deduplicated graph elements for documents in a folder.
+
+        Args:
+            folder_id: Folder UUID
+
+        Returns:
+            Dict with unique 'nodes' and 'relationships' lists
+        """
+        try:
+            self.pipeline_logger.log_step(folder_id, "neo4j_get_folder_graph", "started")
+
+            with self.driver.session() as session:
+                result = session.run("""
+                    MATCH (d:Document)
+                    WHERE d.folder_id = $folder_id
+                    WITH collect(d.id) AS document_ids
+                    MATCH path = (e1)-[r]-(e2)
+                    WHERE r.document_id IN document_ids
+                    UNWIND nodes(path) AS n
+                    WITH collect(DISTINCT n) AS ns, collect(DISTINCT r) AS rs
+                    RETURN ns AS nodes, rs AS relationships
+                """, folder_id=str(folder_id))
+
+                record = result.single()
+                elements = {
+                    "nodes": record["nodes"] if record else [],
+                    "relationships": record["relationships"] if record else []
+                }
+
+                self.pipeline_logger.log_step(folder_id, "neo4j_get_folder_graph", "completed",
+                                            details={"node_count": len(elements["nodes"]),
+                                                    "relationship_count": len(elements["relationships"])})
+
+                return elements
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"Error getting folder graph: {error_msg}")
+            self.pipeline_logger.log_step(folder_id, "neo4j_get_folder_graph", "error",
+                                        details={"error": error_msg})
+            return {"nodes": [], "relationships": []}
+
+    def get_entity_graph_elements(self, entity_name: str, entity_type: str = None) -> Dict[str, List]:
+        """
+        Get deduplicated graph elements around a named entity.
+
+        Args:
+            entity_name: Name of the entity
+            entity_type: Optional entity type to filter by
+
+        Returns:
+            Dict with unique 'nodes' and 'relationships' lists
+        """
+        try:
+            log_id = f"entity_{entity_name}"
+            self.pipeline_logger.log_step(log_id, "neo4j_get_entity_relationships", "started",
+                                        details={"entity_name": entity_name, "entity_type": entity_type})
+
+            with self.driver.session() as session:
+                cypher = """
+                    MATCH (e)-[r]-(related)
+                    WHERE e.name = $name
+                """
+
+                if entity_type:
+                    cypher += f" AND e:{entity_type}"
+
+                cypher += """
+                    WITH collect(r) AS rels, collect(e) + collect(related) AS all_nodes
+                    UNWIND all_nodes AS n
+                    WITH collect(DISTINCT n) AS ns, rels
+                    UNWIND rels AS r
+                    WITH ns, collect(DISTINCT r) AS rs
+                    RETURN ns AS nodes, rs AS relationships
+                """
+
+                result = session.run(cypher, name=entity_name)
+
+                record = result.single()
+                elements = {
+                    "nodes": record["nodes"] if record else [],
+                    "relationships": record["relationships"] if record else []
+                }
+
+                self.pipeline_logger.log_step(log_id, "neo4j_get_entity_relationships", "completed",
+                                            details={"node_count": len(elements["nodes"]),
+                                                    "relationship_count": len(elements["relationships"])})
+
+                return elements
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"Error getting entity relationships: {error_msg}")
+            self.pipeline_logger.log_step(log_id, "neo4j_get_entity_relationships", "error",
+                                        details={"error": error_msg})
+            return {"nodes": [], "relationships": []}
+
     def get_entity_relationships(self, entity_name: str, entity_type: str = None) -> List[Dict]:
         """
         Get relationships for a specific entity.
@@ -3,6 +3,7 @@
 import os
 import logging
 import chromadb
+import numpy as np
 from django.conf import settings
 from .base import VectorIndexer
 
@@ -72,22 +73,29 @@ class ChromaIndexer(VectorIndexer):
                     cleaned_metadata[key] = str(value)
         return cleaned_metadata
     
-    def index(self, chunks, embeddings, metadata):
+    def index(self, chunks, embeddings, metadata, offset=0, total=None):
         """
         Index text chunks and their embeddings with metadata in ChromaDB
-        
+
         Args:
             chunks: List of text chunks to index
             embeddings: List of embeddings for each chunk
             metadata: Dictionary of metadata to store with chunks
-            
+            offset: Index of the first chunk within the whole document,
+                for callers that stream a document in several batches
+            total: Total chunk count for the document (defaults to
+                len(chunks) for single-batch callers)
+
         Returns:
             list: List of IDs for indexed chunks
         """
         if not chunks:
             logger.warning("No chunks provided for indexing")
             return []
-        
+
+        if total is None:
+            total = len(chunks)
+
         # If embeddings are empty but chunks exist, log and return early
         if not embeddings:
             logger.warning("No embeddings provided for indexing. Skipping vector indexing but storing metadata.")
@@ -95,7 +103,7 @@ class ChromaIndexer(VectorIndexer):
             doc_id = metadata.get('document_id', '')
             if not doc_id:
                 doc_id = metadata.get('file_path', 'unknown').replace('/', '_')
-            ids = [f"{doc_id}_chunk_{i}" for i in range(len(chunks))]
+            ids = [f"{doc_id}_chunk_{offset + i}" for i in range(len(chunks))]
             return ids
             
         if len(chunks) != len(embeddings):
@@ -125,15 +133,25 @@ class ChromaIndexer(VectorIndexer):
             # Prepare metadata for each chunk
             for i in range(len(chunks)):
                 # Generate a unique ID for each chunk
-                chunk_id = f"{doc_id}_chunk_{i}"
+                chunk_id = f"{doc_id}_chunk_{offset + i}"
                 ids.append(chunk_id)
-                
+
                 # Copy the cleaned metadata and add chunk-specific information
                 chunk_metadata = cleaned_metadata.copy()
-                chunk_metadata["chunk_index"] = i
-                chunk_metadata["chunk_count"] = len(chunks)
+                chunk_metadata["chunk_index"] = offset + i
+                chunk_metadata["chunk_count"] = total
                 chunk_metadatas.append(chunk_metadata)
             
+            # chromadb 0.4.x validates each embedding as a plain Python
+            # list of int/float - ndarray rows (and float16 elements)
+            # fail its type check and the whole add() raises. Convert at
+            # this boundary; float32 round-trips the float16 storage
+            # exactly.
+            embeddings = [
+                np.asarray(embedding, dtype=np.float32).tolist()
+                for embedding in embeddings
+            ]
+
             # Add all chunks to the collection in a single batch operation
             collection = self._get_collection()
             collection.add(
@@ -223,6 +241,10 @@ class ChromaIndexer(VectorIndexer):
                 # It's an embedding vector
                 embedding_dim = len(query) if hasattr(query, '__len__') else 0
                 logger.info(f"Searching with embedding vector of dimension {embedding_dim}")
+
+                # Same chromadb type requirement as in index(): the query
+                # embedding must be a plain list of floats
+                query = np.asarray(query, dtype=np.float32).tolist()
                 
                 # We need to handle different embedding dimensions
                 try:
@@ -87,22 +87,10 @@ class DocumentService:
                 logger.error(error_msg)
                 raise ValueError(error_msg)
             
-            # STEP 3: Generate embeddings for chunks
-            logger.info(f"Generating embeddings for {len(chunks)} chunks")
-            try:
-                embeddings = self.embedding_generator.generate(chunks)
-                
-                if not embeddings or len(embeddings) != len(chunks):
-                    error_msg = "Failed to generate embeddings for all chunks"
-                    logger.warning(f"{error_msg}: Got {len(embeddings)} embeddings for {len(chunks)} chunks")
-                    raise ValueError(error_msg)
-            except Exception as e:
-                # Instead of failing the entire pipeline, add a warning and continue with the rest of the steps
-                # This allows other parts like graphs to still work
-                logger.warning(f"Error generating embeddings (will continue without them): {str(e)}")
-                embeddings = []  # Set empty embeddings
-            
-            # STEP 4: Index chunks and embeddings
+            # STEP 3+4: Generate embeddings and index, one batch at a time.
+            # Streaming batch-by-batch keeps peak memory at O(batch_size)
+            # embeddings instead of buffering the full vector list for
+            # large documents.
             # Prepare metadata for indexing
             metadata = {
                 "document_id": document_id,
@@ -112,9 +100,35 @@ class DocumentService:
                 "folder_id": str(document.folder.id) if document.folder else None,
                 "folder_path": document.folder_path if document.folder else "Documents"
             }
-            
-            logger.info(f"Indexing {len(chunks)} chunks in vector database")
-            self.indexer.index(chunks, embeddings, metadata)
+
+            # Each window feeds the generator batch_size * concurrency
+            # chunks, so its async fan-out actually has `concurrency`
+            # API requests in flight per generate() call (a window of
+            # exactly batch_size would serialize them and pay the client
+            # setup per 100 chunks). Peak memory stays at one window of
+            # vectors.
+            window_size = (
+                self.embedding_generator.batch_size
+                * max(1, self.embedding_generator.concurrency)
+            )
+            total_chunks = len(chunks)
+            logger.info(f"Embedding and indexing {total_chunks} chunks in windows of {window_size}")
+            for start in range(0, total_chunks, window_size):
+                batch = chunks[start:start + window_size]
+                try:
+                    embeddings = self.embedding_generator.generate(batch)
+
+                    if not embeddings or len(embeddings) != len(batch):
+                        error_msg = "Failed to generate embeddings for all chunks"
+                        logger.warning(f"{error_msg}: Got {len(embeddings)} embeddings for {len(batch)} chunks")
+                        raise ValueError(error_msg)
+                except Exception as e:
+                    # Instead of failing the entire pipeline, add a warning and continue with the rest of the steps
+                    # This allows other parts like graphs to still work
+                    logger.warning(f"Error generating embeddings (will continue without them): {str(e)}")
+                    embeddings = []  # Set empty embeddings
+
+                self.indexer.index(batch, embeddings, metadata, offset=start, total=total_chunks)
             
             # STEP 5: Generate knowledge graph
             logger.info(f"Generating knowledge graph for document")
@@ -4,8 +4,9 @@ import os
 import shutil
 import logging
 import mimetypes
-from django.db.models.signals import post_save, pre_delete, pre_save
-from django.dispatch import receiver
+from django.core.cache import caches
+from django.db.models.signals import post_save, post_delete, pre_delete, pre_save
+from django.dispatch import receiver, Signal
 from django.conf import settings
 from .models import Document, Folder
 # Import tasks properly to ensure they're registered with Celery
@@ -13,22 +14,22 @@ from dochub.tasks.document_tasks import process_document_task
 
 logger = logging.getLogger(__name__)
 
-@receiver(post_save, sender=Document)
-def handle_document_post_save(sender, instance, created, **kwargs):
+# Sent by bulk upload paths that insert documents with bulk_create
+# (which does not fire post_save). Provides: documents (list of Document).
+documents_uploaded = Signal()
+
+def initialize_document(instance):
     """
-    Signal handler for post-save events on Document model.
-    
-    1. Updates file metadata when a document is created
-    2. Triggers the document processing task
-    
+    Set file metadata on a newly created document and queue its
+    processing task. Shared by the post_save handler and the bulk
+    upload signal.
+
     Args:
-        sender: The model class
-        instance: The actual instance being saved
-        created: Boolean; True if a new record was created
+        instance: The Document instance to initialize
     """
-    if created and instance.file:
+    if instance.file:
         logger.debug(f"Document created: {instance.id} - {instance.name}")
-        
+
         try:
             # Update file metadata using mimetypes
             file_path = instance.file.path
@@ -91,6 +92,34 @@ def handle_document_post_save(sender, instance, created, **kwargs):
                 error_message=f"Error initializing document: {str(e)}"
             )
 
+@receiver(post_save, sender=Document)
+def handle_document_post_save(sender, instance, created, **kwargs):
+    """
+    Signal handler for post-save events on Document model.
+
+    1. Updates file metadata when a document is created
+    2. Triggers the document processing task
+
+    Args:
+        sender: The model class
+        instance: The actual instance being saved
+        created: Boolean; True if a new record was created
+    """
+    if created:
+        initialize_document(instance)
+
+@receiver(documents_uploaded)
+def handle_documents_uploaded(sender, documents, **kwargs):
+    """
+    Signal handler for batches of bulk-created documents.
+
+    Args:
+        sender: The sending class
+        documents: List of freshly inserted Document instances
+    """
+    for document in documents:
+        initialize_document(document)
+
 @receiver(pre_delete, sender=Document)
 def handle_document_pre_delete(sender, instance, **kwargs):
     """
@@ -140,6 +169,30 @@ def handle_folder_post_save(sender, instance, created, **kwargs):
         except Exception as e:
             logger.error(f"Error creating folder directory: {str(e)}")
 
+@receiver(post_save, sender=Folder)
+def cascade_folder_path_updates(sender, instance, created, **kwargs):
+    """
+    Keep descendant materialized paths in sync after a rename or move.
+
+    Each corrected child save fires this handler again, so the cascade
+    walks the subtree level by level and stops as soon as paths match.
+
+    Args:
+        sender: The model class
+        instance: The actual instance being saved
+        created: Boolean; True if a new record was created
+    """
+    if created:
+        return
+
+    for child in instance.subfolders.all():
+        expected = os.path.join(instance.path, child.name)
+        if child.path != expected:
+            # Prime the FK cache so child.save() reads the fresh parent
+            # path without another query
+            child.parent = instance
+            child.save(update_fields=['path', 'updated_at'])
+
 @receiver(pre_delete, sender=Folder)
 def handle_folder_pre_delete(sender, instance, **kwargs):
     """
@@ -199,6 +252,22 @@ def handle_folder_pre_save(sender, instance, **kwargs):
     except Exception as e:
         logger.error(f"Error in folder pre-save signal handler: {str(e)}")
 
+@receiver(post_save, sender=Folder)
+@receiver(post_delete, sender=Folder)
+@receiver(post_save, sender=Document)
+@receiver(post_delete, sender=Document)
+def invalidate_cached_responses(sender, **kwargs):
+    """
+    Drop cached folder/document GET responses whenever the underlying
+    rows change, so cache_page never serves stale listings.
+
+    Only the page-cache alias is cleared: the default cache holds
+    permanent embedding entries and rendered graph payloads, and the
+    pipeline saves documents several times per run, so clearing it here
+    would wipe those right after they were written.
+    """
+    caches['pages'].clear()
+
 def get_folder_physical_path(folder, use_new_name=False):
     """
     Get the physical path for a folder in the media directory.
@@ -213,7 +282,5 @@ def get_folder_physical_path(folder, use_new_name=False):
     # Base media path where all folders will be stored
     media_root = settings.MEDIA_ROOT
     
-    folder_path = build_folder_path(folder)
-    
     # Join the media root with 'folders' directory and the folder path
-    return os.path.join(media_root, 'folders', folder_path)
\ No newline at end of file
+    return os.path.join(media_root, 'folders', folder.path)
\ No newline at end of file
@@ -5,10 +5,18 @@ from .document_tasks import (
     reprocess_failed_document,
     mock_process_document_task
 )
+from .graph_tasks import (
+    build_document_graph,
+    build_folder_graph,
+    build_entity_graph
+)
 
 __all__ = [
     'process_document_task',
     'cleanup_processing_documents',
     'reprocess_failed_document',
-    'mock_process_document_task'
-]
\ No newline at end of file
+    'mock_process_document_task',
+    'build_document_graph',
+    'build_folder_graph',
+    'build_entity_graph'
+]
@@ -0,0 +1,138 @@
+# backend/dochub/tasks/graph_tasks.py
+
+import logging
+from celery import shared_task
+from django.core.cache import cache
+
+from ..pipeline.graphs.client import Neo4jClient
+from ..utils.graph_visualizer import GraphVisualizer
+
+logger = logging.getLogger(__name__)
+
+# How long rendered graph payloads stay cached (seconds)
+GRAPH_CACHE_TIMEOUT = 3600
+
+# Shared Neo4j client: the driver pools connections and is thread-safe,
+# so one instance per process avoids a connection handshake per task.
+_neo4j_client = None
+
+def get_neo4j_client():
+    """Get the process-wide Neo4jClient, creating it on first use."""
+    global _neo4j_client
+    if _neo4j_client is None:
+        _neo4j_client = Neo4jClient()
+    return _neo4j_client
+
+def graph_cache_key(kind, identifier, format_type):
+    """Cache key for a rendered graph payload."""
+    return f"graph:{kind}:{identifier}:{format_type}"
+
+def build_graph_response(elements, format_type):
+    """
+    Convert deduplicated Neo4j elements into a react-force-graph payload.
+
+    Args:
+        elements: Dict with unique 'nodes' and 'relationships' lists
+        format_type: '2d' or '3d'
+
+    Returns:
+        dict: Formatted graph data
+    """
+    # _properties is the dict the driver already holds for each entity;
+    # referencing it directly skips a per-record copy. GraphVisualizer
+    # only reads from the property bags, so sharing them is safe.
+    nodes = [
+        {
+            "id": str(node.id),
+            "labels": list(node.labels),
+            "properties": node._properties
+        }
+        for node in elements["nodes"]
+    ]
+    relationships = [
+        {
+            "id": str(rel.id),
+            "type": rel.type,
+            "start_node": str(rel.start_node.id),
+            "end_node": str(rel.end_node.id),
+            "properties": rel._properties
+        }
+        for rel in elements["relationships"]
+    ]
+
+    processed_data = GraphVisualizer.process_neo4j_graph(nodes, relationships)
+
+    if format_type == '3d':
+        return GraphVisualizer.to_force_graph_3d_format(processed_data)
+    return GraphVisualizer.to_force_graph_format(processed_data)
+
+@shared_task
+def build_document_graph(document_id, format_type='2d'):
+    """
+    Build and cache the rendered graph payload for a document.
+
+    Args:
+        document_id: Document UUID
+        format_type: '2d' or '3d'
+
+    Returns:
+        dict: Build status
+    """
+    try:
+        client = get_neo4j_client()
+        elements = client.get_document_graph_elements(document_id)
+        payload = build_graph_response(elements, format_type)
+        cache.set(graph_cache_key('document', document_id, format_type), payload, GRAPH_CACHE_TIMEOUT)
+        return {"status": "success", "document_id": document_id}
+    except Exception as e:
+        logger.error(f"Error building document graph for {document_id}: {str(e)}")
+        return {"status": "error", "document_id": document_id, "error": str(e)}
+
+@shared_task
+def build_folder_graph(folder_id, format_type='2d'):
+    """
+    Build and cache the rendered graph payload for a folder.
+
+    Args:
+        folder_id: Folder UUID
+        format_type: '2d' or '3d'
+
+    Returns:
+        dict: Build status
+    """
+    try:
+        client = get_neo4j_client()
+        elements = client.get_folder_graph_elements(folder_id=folder_id)
+        payload = build_graph_response(elements, format_type)
+        cache.set(graph_cache_key('folder', folder_id, format_type), payload, GRAPH_CACHE_TIMEOUT)
+        return {"status": "success", "folder_id": folder_id}
+    except Exception as e:
+        logger.error(f"Error building folder graph for {folder_id}: {str(e)}")
+        return {"status": "error", "folder_id": folder_id, "error": str(e)}
+
+@shared_task
+def build_entity_graph(entity_name, entity_type=None, format_type='2d'):
+    """
+    Build and cache the rendered graph payload around an entity.
+
+    Args:
+        entity_name: Name of the entity
+        entity_type: Optional entity type to filter by
+        format_type: '2d' or '3d'
+
+    Returns:
+        dict: Build status
+    """
+    try:
+        client = get_neo4j_client()
+        elements = client.get_entity_graph_elements(entity_name, entity_type)
+        payload = build_graph_response(elements, format_type)
+        cache.set(
+            graph_cache_key('entity', f"{entity_name}:{entity_type}", format_type),
+            payload,
+            GRAPH_CACHE_TIMEOUT
+        )
+        return {"status": "success", "entity_name": entity_name}
+    except Exception as e:
+        logger.error(f"Error building entity graph for {entity_name}: {str(e)}")
+        return {"status": "error", "entity_name": entity_name, "error": str(e)}
@@ -1,3 +1,17 @@
+import os
+
 from django.test import TestCase
 
-# Create your tests here.
+from dochub import models
+
+
+class ModelsPackageTests(TestCase):
+    """Regression guard for the models package layout."""
+
+    def test_models_is_a_package(self):
+        # The legacy single-module models.py was deleted in favor of the
+        # models/ package; if it reappears it would shadow the package
+        # and win the import race.
+        self.assertTrue(
+            models.__file__.replace(os.sep, '/').endswith('models/__init__.py')
+        )
@@ -182,11 +182,14 @@ class PipelineLogger:
         if chunks:
             self.log(f"First chunk sample: {chunks[0][:500]}...")
         
-        # Save all chunks
+        # Save all chunks in one artifact instead of one file write per
+        # chunk: a 10k-chunk document costs one open/write, not 10k
         if self.save_artifacts:
-            for i, chunk in enumerate(chunks):
-                self.save_text(f'chunk_{i+1}.txt', chunk)
-            
+            self.save_json('chunks.json', [
+                {'chunk_id': i+1, 'text': chunk}
+                for i, chunk in enumerate(chunks)
+            ])
+
             # Save chunk metadata
             chunk_meta = [
                 {'chunk_id': i+1, 'length': len(chunk), 'preview': chunk[:100]}